@@ -0,0 +1,659 @@
+"""
+Shared gem5 RISC-V System Builder
+=================================
+
+Common pieces of fs_config.py and se_config.py:
+  - Command-line options shared by both modes
+  - System, CPU, cache hierarchy and memory controller construction
+  - The simulate / report loop
+
+fs_config.py and se_config.py only add their mode-specific options and
+workload. gem5 puts the config script's directory first on sys.path, so
+both scripts can import this module directly.
+"""
+
+import os
+import shutil
+
+import m5
+from m5.objects import *
+from m5.util import fatal
+
+# =============================================================================
+# CPU Models
+# =============================================================================
+
+# Resolved once; --cpu-type keys into this table
+CPU_TYPES = {
+    name: getattr(m5.objects, name)
+    for name in ("AtomicSimpleCPU", "TimingSimpleCPU", "MinorCPU", "DerivO3CPU")
+}
+
+# Bundled Ramulator2 configuration for --mem-model=ramulator2
+RAMULATOR2_CONFIG = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "ramulator2.yaml"
+)
+
+# =============================================================================
+# Cache Parameters (sizes and MSHRs come from the command line)
+# =============================================================================
+
+L1I_PARAMS = dict(
+    assoc=2,
+    tag_latency=1,
+    data_latency=1,
+    response_latency=1,
+    tgts_per_mshr=8,
+)
+
+L1D_PARAMS = dict(
+    assoc=4,
+    tag_latency=2,
+    data_latency=2,
+    response_latency=2,
+    tgts_per_mshr=8,
+)
+
+L2_PARAMS = dict(
+    assoc=8,
+    tag_latency=10,
+    data_latency=10,
+    response_latency=10,
+)
+
+# =============================================================================
+# Command-Line Arguments
+# =============================================================================
+
+
+def add_common_arguments(parser):
+    """Add the options shared by the FS and SE configurations."""
+    parser.add_argument(
+        "--cpu-type",
+        default="AtomicSimpleCPU",
+        choices=list(CPU_TYPES),
+        help="CPU model to use (default: AtomicSimpleCPU)",
+    )
+    parser.add_argument(
+        "--num-cpus", type=int, default=1, help="Number of CPU cores (default: 1)"
+    )
+    parser.add_argument(
+        "--mem-size", default="128MB", help="Memory size (default: 128MB)"
+    )
+    parser.add_argument(
+        "--l1d-size", default="32kB", help="L1 data cache size (default: 32kB)"
+    )
+    parser.add_argument(
+        "--l1i-size", default="32kB", help="L1 instruction cache size (default: 32kB)"
+    )
+    parser.add_argument(
+        "--l2-size", default="256kB", help="L2 cache size (default: 256kB)"
+    )
+    parser.add_argument(
+        "--l1i-mshrs",
+        type=int,
+        default=8,
+        help="L1 instruction cache MSHRs (default: 8)",
+    )
+    parser.add_argument(
+        "--l1d-mshrs",
+        type=int,
+        default=32,
+        help="L1 data cache MSHRs (default: 32). 16 caps memory-level "
+        "parallelism on O3 runs; XiangShan tuning found 16->32 lets more "
+        "misses and prefetches stay in flight at no modelling cost",
+    )
+    parser.add_argument(
+        "--l2-mshrs", type=int, default=32, help="L2 cache MSHRs (default: 32)"
+    )
+    parser.add_argument(
+        "--l2-tgts-per-mshr",
+        type=int,
+        default=16,
+        help="L2 targets per MSHR (default: 16)",
+    )
+    parser.add_argument(
+        "--mem-model",
+        default=None,
+        choices=["internal", "ramulator2", "simple"],
+        help="Memory model: internal gem5 DDR4 controller, external "
+        "Ramulator2 (needs gem5 built with ext/ramulator2) or calibrated "
+        "fixed-latency SimpleMemory for fast, coarse sweeps (default: simple "
+        "for AtomicSimpleCPU, whose requests ignore DRAM timing; internal "
+        "otherwise)",
+    )
+    parser.add_argument(
+        "--functional",
+        action="store_true",
+        help="AtomicSimpleCPU only: atomic_noncaching memory mode, a zero-"
+        "latency non-coherent memory bus and 1ns SimpleMemory, for fast "
+        "boot/smoke tests with no timing fidelity",
+    )
+    parser.add_argument(
+        "--ramulator2-config",
+        default=RAMULATOR2_CONFIG,
+        help="Ramulator2 YAML config for --mem-model=ramulator2 "
+        "(default: ramulator2.yaml next to this script)",
+    )
+    parser.add_argument(
+        "--max-ticks",
+        type=int,
+        default=10000000000,
+        help="Maximum simulation ticks (default: 10B)",
+    )
+    parser.add_argument(
+        "--fast-forward",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Run N instructions on AtomicSimpleCPU, then write a checkpoint "
+        "to --checkpoint-dir and exit (default: 0, disabled)",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        default=None,
+        metavar="PATH",
+        help="Where --fast-forward writes its checkpoint "
+        "(default: <outdir>/cpt.ff)",
+    )
+    parser.add_argument(
+        "--restore",
+        default=None,
+        metavar="PATH",
+        help="Restore a checkpoint and continue under --cpu-type",
+    )
+    parser.add_argument(
+        "--warmup-insts",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Run the first N instructions on AtomicSimpleCPU (warming the "
+        "caches), reset stats, then switch to --cpu-type (default: 0)",
+    )
+    parser.add_argument(
+        "--detailed-insts",
+        type=int,
+        default=0,
+        metavar="M",
+        help="Stop after M instructions on --cpu-type; with --simpoint-file, "
+        "the length of each simulated region (default: 0, run to the end / "
+        "--simpoint-interval)",
+    )
+    parser.add_argument(
+        "--simpoint-file",
+        default=None,
+        metavar="FILE",
+        help="SimPoint .simpoints file ('<interval> <id>' per line): run on "
+        "AtomicSimpleCPU up to each simpoint and simulate it on --cpu-type, "
+        "dumping stats per simpoint; the run ends after the last one",
+    )
+    parser.add_argument(
+        "--simpoint-weights",
+        default=None,
+        metavar="FILE",
+        help="SimPoint .weights file ('<weight> <id>' per line), reported "
+        "with each simpoint's stats dump",
+    )
+    parser.add_argument(
+        "--simpoint-interval",
+        type=int,
+        default=100000000,
+        metavar="N",
+        help="Instructions per SimPoint interval (default: 100M)",
+    )
+    parser.add_argument(
+        "--reset-tick-on-restore",
+        action="store_true",
+        help="Restore from a copy of the checkpoint (in the output directory) "
+        "with curTick set to 0, so the restored run does not start at the "
+        "fast-forwarded tick",
+    )
+
+
+# =============================================================================
+# System Construction
+# =============================================================================
+
+
+def _add_hifive_platform(system, num_cpus):
+    """Attach the HiFive platform (UART, CLINT, PLIC) and its IO buses.
+
+    Uses RiscvSystem + HiFive for gem5 25.x compatibility: Uart8250 requires a
+    Platform parent (platform=Parent.any). HiFive provides UART at 0x10000000
+    and CLINT at 0x02000000, matching the app.
+    """
+    system.platform = HiFive()
+
+    # Redirect terminal output to stdout (required for non-interactive/CI runs)
+    # Default "file" dumps to a file; "stdoutput" prints to gem5's stdout
+    system.platform.terminal.outfile = "stdoutput"
+
+    # RTCCLK for CLINT timer
+    system.platform.rtc = RiscvRTC(frequency=Frequency("100MHz"))
+    system.platform.clint.int_pin = system.platform.rtc.int_pin
+
+    system.iobus = IOXBar()
+
+    # Connect platform PCI host to IO bus (required for HiFive off-chip devices)
+    system.iobus.cpu_side_ports = system.platform.pci_host.up_request_port()
+    system.iobus.mem_side_ports = system.platform.pci_host.up_response_port()
+    system.platform.pci_bus.cpu_side_ports = (
+        system.platform.pci_host.down_request_port()
+    )
+    system.platform.pci_bus.default = system.platform.pci_host.down_response_port()
+    system.platform.pci_bus.config_error_port = (
+        system.platform.pci_host.config_error.pio
+    )
+
+    # Bridge: IO bus <-> memory bus
+    system.bridge = Bridge(delay="50ns")
+    system.bridge.mem_side_port = system.iobus.cpu_side_ports
+    system.bridge.cpu_side_port = system.membus.mem_side_ports
+    system.bridge.ranges = system.platform._off_chip_ranges()
+
+    # Attach platform devices (CLINT, PLIC to membus; UART to iobus)
+    system.platform.attachOnChipIO(system.membus)
+    system.platform.attachOffChipIO(system.iobus)
+    system.platform.attachPlic()
+    system.platform.setNumCores(num_cpus)
+
+
+def _add_caches(system, args):
+    """Give each CPU private L1 I/D caches behind a shared L2.
+
+    The L2 is left unconnected on its memory side; build_system binds it to
+    the memory bus with the other requestors.
+    """
+    system.l2bus = L2XBar()
+
+    l1_mem_sides = []
+    for cpu in system.cpu:
+        cpu.icache = Cache(size=args.l1i_size, mshrs=args.l1i_mshrs, **L1I_PARAMS)
+        cpu.icache.cpu_side = cpu.icache_port
+
+        cpu.dcache = Cache(size=args.l1d_size, mshrs=args.l1d_mshrs, **L1D_PARAMS)
+        cpu.dcache.cpu_side = cpu.dcache_port
+
+        l1_mem_sides += [cpu.icache.mem_side, cpu.dcache.mem_side]
+    system.l2bus.cpu_side_ports = l1_mem_sides
+
+    system.l2cache = Cache(
+        size=args.l2_size,
+        mshrs=args.l2_mshrs,
+        tgts_per_mshr=args.l2_tgts_per_mshr,
+        **L2_PARAMS,
+    )
+    system.l2cache.cpu_side = system.l2bus.mem_side_ports
+
+
+def _add_mem_ctrl(system, args):
+    """Attach the --mem-model memory behind the memory bus."""
+    model = mem_model(args)
+    if model == "functional":
+        system.mem_ctrl = SimpleMemory(range=system.mem_ranges[0], latency="1ns")
+    elif model == "ramulator2":
+        ramulator2_class = getattr(m5.objects, "Ramulator2", None)
+        if ramulator2_class is None:
+            fatal("--mem-model=ramulator2 needs gem5 built with ext/ramulator2")
+        system.mem_ctrl = ramulator2_class()
+        system.mem_ctrl.config_path = args.ramulator2_config
+        system.mem_ctrl.range = system.mem_ranges[0]
+    elif model == "simple":
+        # Fixed latency/bandwidth calibrated against DDR4-2400 averages: far
+        # fewer events per access than the DDR4 row/refresh state machine
+        system.mem_ctrl = SimpleMemory(
+            range=system.mem_ranges[0],
+            latency="70ns",
+            latency_var="10ns",
+            bandwidth="12.8GB/s",
+        )
+        system.membus.response_latency = 10
+    else:
+        system.mem_ctrl = MemCtrl()
+        system.mem_ctrl.dram = DDR4_2400_16x4()
+        system.mem_ctrl.dram.range = system.mem_ranges[0]
+    system.mem_ctrl.port = system.membus.mem_side_ports
+
+
+def switches_cpus(args):
+    """True if the run starts on Atomic and switches to --cpu-type."""
+    return bool(args.warmup_insts or args.simpoint_file)
+
+
+def run_cpu_type(args):
+    """CPU model the system starts on (Atomic while fast-forwarding/warming)."""
+    if args.fast_forward or switches_cpus(args):
+        return "AtomicSimpleCPU"
+    return args.cpu_type
+
+
+def timed_cpu_type(args):
+    """CPU model the cache and memory hierarchy is built for."""
+    return "AtomicSimpleCPU" if args.fast_forward else args.cpu_type
+
+
+def mem_model(args):
+    """Memory model in use: --mem-model, or the default for the CPU type."""
+    if args.functional:
+        return "functional"
+    if args.mem_model:
+        return args.mem_model
+    return "simple" if "Atomic" in timed_cpu_type(args) else "internal"
+
+
+def all_cpus(system):
+    """Every CPU in system, including switched-out detailed CPUs."""
+    return list(system.cpu) + list(getattr(system, "switch_cpus", []))
+
+
+def build_system(args, full_system):
+    """Build the RISC-V system described by args, without a workload.
+
+    full_system selects RiscvSystem + HiFive platform (bare-metal FS mode);
+    otherwise a plain System for syscall emulation.
+    """
+    system = RiscvSystem() if full_system else System()
+    cpu_type = run_cpu_type(args)
+    if args.functional and "Atomic" not in timed_cpu_type(args):
+        fatal("--functional requires --cpu-type=AtomicSimpleCPU")
+    if switches_cpus(args) or args.detailed_insts:
+        if args.fast_forward:
+            fatal("--fast-forward cannot be combined with sampling options")
+        if switches_cpus(args) and "Atomic" in args.cpu_type:
+            fatal("--warmup-insts/--simpoint-file need a detailed --cpu-type")
+        if args.warmup_insts and args.simpoint_file:
+            fatal("--simpoint-file already runs Atomic up to each simpoint; "
+                  "drop --warmup-insts")
+
+    # Clock domain
+    system.clk_domain = SrcClockDomain()
+    system.clk_domain.clock = "1GHz"
+    system.clk_domain.voltage_domain = VoltageDomain()
+
+    # Memory mode depends on CPU type
+    if args.functional:
+        system.mem_mode = "atomic_noncaching"
+    elif "Atomic" in cpu_type:
+        system.mem_mode = "atomic"
+    else:
+        system.mem_mode = "timing"
+
+    # Memory range: bare-metal binary expects 0x80000000 (RISC-V standard)
+    system.mem_ranges = [AddrRange(start=0x80000000, size=args.mem_size)]
+
+    if args.functional:
+        # Nothing to keep coherent without caches; forward with no delay
+        system.membus = NoncoherentXBar(
+            frontend_latency=0, forward_latency=0, response_latency=0, width=64
+        )
+    else:
+        system.membus = SystemXBar()
+
+    # Requestors on the memory bus, bound in one vector assignment below
+    membus_requestors = [system.system_port]
+
+    if full_system:
+        _add_hifive_platform(system, args.num_cpus)
+
+    # CPUs
+    cpu_class = CPU_TYPES[cpu_type]
+    system.cpu = [cpu_class() for _ in range(args.num_cpus)]
+
+    for i, cpu in enumerate(system.cpu):
+        cpu.cpu_id = i
+        cpu.createInterruptController()
+        cpu.createThreads()
+        if args.fast_forward:
+            # Exit the simulation loop once any hart reaches N instructions
+            cpu.max_insts_any_thread = args.fast_forward
+        elif args.detailed_insts and not switches_cpus(args):
+            cpu.max_insts_any_thread = args.detailed_insts
+
+    if switches_cpus(args):
+        # Detailed CPUs, switched in by run_simulation; they share the ISA
+        # objects and take over the Atomic CPUs' ports and interrupts
+        detailed_class = CPU_TYPES[args.cpu_type]
+        system.switch_cpus = [
+            detailed_class(switched_out=True, cpu_id=i)
+            for i in range(args.num_cpus)
+        ]
+        for cpu, switch_cpu in zip(system.cpu, system.switch_cpus):
+            switch_cpu.isa = cpu.isa
+            switch_cpu.createInterruptController()
+            switch_cpu.createThreads()
+
+    if full_system:
+        # PMA checker for uncacheable device regions
+        uncacheable_range = [
+            *system.platform._on_chip_ranges(),
+            *system.platform._off_chip_ranges(),
+        ]
+        for cpu in all_cpus(system):
+            cpu.mmu.pma_checker = PMAChecker(uncacheable=uncacheable_range)
+
+    # Memory hierarchy (switched-in CPUs inherit the Atomic CPUs' ports)
+    if "Atomic" in timed_cpu_type(args):
+        # Atomic CPU: connect directly to memory bus (no caches needed)
+        for cpu in system.cpu:
+            membus_requestors += [cpu.icache_port, cpu.dcache_port]
+    else:
+        # Timing/Minor/O3 CPU: add L1 caches + L2
+        _add_caches(system, args)
+        membus_requestors.append(system.l2cache.mem_side)
+
+    # Memory controller
+    _add_mem_ctrl(system, args)
+
+    if full_system:
+        # IO bridge for memory access from IO devices
+        system.iobridge = Bridge(delay="50ns", ranges=system.mem_ranges)
+        system.iobridge.cpu_side_port = system.iobus.mem_side_ports
+        membus_requestors.append(system.iobridge.mem_side_port)
+
+    system.membus.cpu_side_ports = membus_requestors
+
+    return system
+
+
+# =============================================================================
+# Simulation
+# =============================================================================
+
+
+def _reset_checkpoint_tick(checkpoint_dir):
+    """Return a copy of checkpoint_dir whose [Globals] curTick is 0.
+
+    The copy lives in the output directory and the original is left
+    untouched, so parallel runs can restore the same checkpoint. Only m5.cpt
+    is rewritten; the other files (memory images can be GBs) are symlinked.
+    """
+    copy_dir = os.path.join(m5.options.outdir, "cpt.restore")
+    if os.path.realpath(checkpoint_dir) == os.path.realpath(copy_dir):
+        fatal(f"Cannot restore {checkpoint_dir} with --reset-tick-on-restore "
+              "into the same output directory")
+    if os.path.lexists(copy_dir):
+        shutil.rmtree(copy_dir)
+    os.makedirs(copy_dir)
+    for name in os.listdir(checkpoint_dir):
+        if name != "m5.cpt":
+            os.symlink(
+                os.path.abspath(os.path.join(checkpoint_dir, name)),
+                os.path.join(copy_dir, name),
+            )
+
+    with open(os.path.join(checkpoint_dir, "m5.cpt"), "r") as f:
+        lines = f.readlines()
+
+    section = None
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("["):
+            section = stripped
+        elif section == "[Globals]" and stripped.startswith("curTick="):
+            lines[i] = "curTick=0\n"
+            break
+
+    with open(os.path.join(copy_dir, "m5.cpt"), "w") as f:
+        f.writelines(lines)
+    return copy_dir
+
+
+def _read_simpoints(args):
+    """Return [(start_inst, simpoint_id, weight)] sorted by start."""
+    weights = {}
+    if args.simpoint_weights:
+        with open(args.simpoint_weights, "r") as f:
+            for line in f:
+                if line.strip():
+                    weight, simpoint_id = line.split()
+                    weights[int(simpoint_id)] = float(weight)
+
+    simpoints = []
+    with open(args.simpoint_file, "r") as f:
+        for line in f:
+            if line.strip():
+                interval, simpoint_id = (int(v) for v in line.split())
+                simpoints.append(
+                    (
+                        interval * args.simpoint_interval,
+                        simpoint_id,
+                        weights.get(simpoint_id),
+                    )
+                )
+    return sorted(simpoints)
+
+
+def _simulate_until(deadline):
+    """Simulate until an exit event or the absolute tick deadline."""
+    return m5.simulate(max(deadline - m5.curTick(), 0))
+
+
+def _run_switched(args, system, deadline):
+    """Run Atomic -> --cpu-type sampling; returns the last exit event.
+
+    Without --simpoint-file: --warmup-insts on Atomic, then --cpu-type for
+    --detailed-insts (or to the end). With it: Atomic up to each simpoint,
+    then --cpu-type for one region, dumping stats per simpoint; the run
+    ends after the last simpoint.
+    """
+    to_detailed = list(zip(system.cpu, system.switch_cpus))
+    to_atomic = [(new, old) for old, new in to_detailed]
+
+    if not args.simpoint_file:
+        system.cpu[0].scheduleInstStop(0, args.warmup_insts, "warmup done")
+        exit_event = _simulate_until(deadline)
+        if exit_event.getCause() != "warmup done":
+            return exit_event
+
+        print(f"[gem5] Warmup done at tick {m5.curTick()}; "
+              f"switching to {args.cpu_type}")
+        m5.stats.reset()
+        m5.switchCpus(system, to_detailed)
+        if args.detailed_insts:
+            system.switch_cpus[0].scheduleInstStop(
+                0, args.detailed_insts, "detailed done"
+            )
+        return _simulate_until(deadline)
+
+    simpoints = _read_simpoints(args)
+    if not simpoints:
+        fatal(f"No simpoints in {args.simpoint_file}")
+    region_insts = args.detailed_insts or args.simpoint_interval
+    executed = 0  # hart 0 instructions retired so far, across both CPU sets
+    exit_event = None
+    for index, (start, simpoint_id, weight) in enumerate(simpoints, 1):
+        if start < executed:
+            print(f"[gem5] Skipping simpoint {simpoint_id}: overlaps previous")
+            continue
+        if start > executed:
+            system.cpu[0].scheduleInstStop(0, start - executed, "simpoint start")
+            exit_event = _simulate_until(deadline)
+            if exit_event.getCause() != "simpoint start":
+                return exit_event
+
+        m5.stats.reset()
+        m5.switchCpus(system, to_detailed)
+        system.switch_cpus[0].scheduleInstStop(0, region_insts, "simpoint end")
+        exit_event = _simulate_until(deadline)
+        m5.stats.dump()
+        print(f"[gem5] Simpoint {simpoint_id} (weight {weight}): "
+              f"insts {start}-{start + region_insts}, stats dumped")
+        # Stop after the last simpoint: running the rest of the program on
+        # Atomic would only add unmeasured work to the stats dumped at exit
+        if exit_event.getCause() != "simpoint end" or index == len(simpoints):
+            return exit_event
+
+        m5.switchCpus(system, to_atomic)
+        executed = start + region_insts
+
+    # The remaining simpoints overlapped the last region that ran
+    return exit_event
+
+
+def run_simulation(args, mode, system):
+    """Instantiate, simulate up to --max-ticks and report; returns exit code.
+
+    With --fast-forward, a checkpoint is written once the instruction limit
+    is reached. With --restore, the run starts from that checkpoint. With
+    --warmup-insts or --simpoint-file, execution starts on Atomic and
+    switches to --cpu-type for the measured region(s).
+    """
+    if args.restore:
+        if not os.path.isdir(args.restore):
+            fatal(f"Checkpoint directory not found: {args.restore}")
+        checkpoint_dir = args.restore
+        if args.reset_tick_on_restore:
+            checkpoint_dir = _reset_checkpoint_tick(args.restore)
+        m5.instantiate(checkpoint_dir)
+    else:
+        m5.instantiate()
+
+    print(f"[gem5] Starting {mode} simulation:")
+    print(f"[gem5]   Binary:    {args.cmd}")
+    print(f"[gem5]   CPU Type:  {timed_cpu_type(args)}")
+    print(f"[gem5]   Num CPUs:  {args.num_cpus}")
+    print(f"[gem5]   Mem Size:  {args.mem_size}")
+    print(f"[gem5]   Mem Model: {mem_model(args)}")
+    print(f"[gem5]   Max Ticks: {args.max_ticks}")
+    if args.fast_forward:
+        print(f"[gem5]   Fast-Fwd:  {args.fast_forward} insts")
+    if args.restore:
+        print(f"[gem5]   Restore:   {args.restore}")
+    if args.warmup_insts:
+        print(f"[gem5]   Warmup:    {args.warmup_insts} insts (Atomic)")
+    if args.detailed_insts:
+        print(f"[gem5]   Detailed:  {args.detailed_insts} insts")
+    if args.simpoint_file:
+        print(f"[gem5]   SimPoints: {args.simpoint_file}")
+    if "Atomic" not in timed_cpu_type(args):
+        print(f"[gem5]   L1d Size:  {args.l1d_size}")
+        print(f"[gem5]   L1i Size:  {args.l1i_size}")
+        print(f"[gem5]   L2 Size:   {args.l2_size}")
+    print()
+
+    if switches_cpus(args):
+        exit_event = _run_switched(args, system, m5.curTick() + args.max_ticks)
+    else:
+        exit_event = m5.simulate(args.max_ticks)
+
+    print()
+    print(f"[gem5] Simulation finished at tick {m5.curTick()}")
+    print(f"[gem5] Exit cause: {exit_event.getCause()}")
+    print(f"[gem5] Exit code:  {exit_event.getCode()}")
+
+    if args.fast_forward:
+        if exit_event.getCause() == "a thread reached the max instruction count":
+            checkpoint_dir = args.checkpoint_dir or os.path.join(
+                m5.options.outdir, "cpt.ff"
+            )
+            m5.checkpoint(checkpoint_dir)
+            print(f"[gem5] Checkpoint: {checkpoint_dir}")
+        else:
+            print("[gem5] Fast-forward ended early; no checkpoint written")
+
+    # Print basic stats summary
+    stats_file = os.path.join(m5.options.outdir, "stats.txt")
+    if os.path.exists(stats_file):
+        print(f"[gem5] Stats file: {stats_file}")
+
+    return exit_event.getCode()
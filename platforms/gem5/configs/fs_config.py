@@ -20,10 +20,31 @@ Options:
                 DerivO3CPU (default: AtomicSimpleCPU)
   --num-cpus    Number of CPU cores (default: 1)
   --mem-size    Memory size (default: 128MB)
+  --mem-model   Memory model: internal, ramulator2, simple
+                (default: simple for AtomicSimpleCPU, internal otherwise)
+  --functional  AtomicSimpleCPU only: zero-latency bus and memory for smoke tests
   --l1d-size    L1 data cache size (default: 32kB)
   --l1i-size    L1 instruction cache size (default: 32kB)
   --l2-size     L2 cache size (default: 256kB)
+  --l1i-mshrs / --l1d-mshrs / --l2-mshrs
+                Cache MSHR counts (default: 8 / 32 / 32)
+  --l2-tgts-per-mshr
+                L2 targets per MSHR (default: 16)
   --max-ticks   Maximum simulation ticks (default: 10000000000)
+  --fast-forward N
+                Run N insts on AtomicSimpleCPU, checkpoint and exit
+  --checkpoint-dir PATH
+                Checkpoint written by --fast-forward (default: m5out/cpt.ff)
+  --restore PATH
+                Restore a checkpoint and continue under --cpu-type
+  --reset-tick-on-restore
+                Restore from a copy with curTick set to 0
+  --warmup-insts N
+                Run N insts on AtomicSimpleCPU, then switch to --cpu-type
+  --detailed-insts M
+                Stop after M insts on --cpu-type (per simpoint with SimPoints)
+  --simpoint-file FILE / --simpoint-weights FILE / --simpoint-interval N
+                Simulate only the SimPoint regions on --cpu-type
   --cmd         Path to the bare-metal ELF binary (required)
 """
 
@@ -31,9 +52,9 @@ import argparse
 import os
 import sys
 
-import m5
 from m5.objects import *
-from m5.util import addToPath
+
+from _common import add_common_arguments, build_system, run_simulation
 
 # =============================================================================
 # Parse Command-Line Arguments
@@ -42,33 +63,7 @@ from m5.util import addToPath
 parser = argparse.ArgumentParser(
     description="gem5 RISC-V Full System bare-metal configuration"
 )
-parser.add_argument(
-    "--cpu-type",
-    default="AtomicSimpleCPU",
-    choices=["AtomicSimpleCPU", "TimingSimpleCPU", "MinorCPU", "DerivO3CPU"],
-    help="CPU model to use (default: AtomicSimpleCPU)",
-)
-parser.add_argument(
-    "--num-cpus", type=int, default=1, help="Number of CPU cores (default: 1)"
-)
-parser.add_argument(
-    "--mem-size", default="128MB", help="Memory size (default: 128MB)"
-)
-parser.add_argument(
-    "--l1d-size", default="32kB", help="L1 data cache size (default: 32kB)"
-)
-parser.add_argument(
-    "--l1i-size", default="32kB", help="L1 instruction cache size (default: 32kB)"
-)
-parser.add_argument(
-    "--l2-size", default="256kB", help="L2 cache size (default: 256kB)"
-)
-parser.add_argument(
-    "--max-ticks",
-    type=int,
-    default=10000000000,
-    help="Maximum simulation ticks (default: 10B)",
-)
+add_common_arguments(parser)
 parser.add_argument(
     "--cmd", "--kernel", required=True, help="Path to bare-metal ELF binary"
 )
@@ -81,155 +76,10 @@ if not os.path.exists(args.cmd):
     sys.exit(1)
 
 # =============================================================================
-# System Configuration
+# System Configuration (RiscvSystem + HiFive platform, see _common.py)
 # =============================================================================
-# Use RiscvSystem + HiFive platform for gem5 25.x compatibility.
-# In gem5 25.x, Uart8250 requires a Platform parent (platform=Parent.any).
-# HiFive provides UART at 0x10000000, CLINT at 0x02000000, matching our app.
-# =============================================================================
-
-system = RiscvSystem()
-
-# Clock domain
-system.clk_domain = SrcClockDomain()
-system.clk_domain.clock = "1GHz"
-system.clk_domain.voltage_domain = VoltageDomain()
-
-# Memory mode depends on CPU type
-if "Atomic" in args.cpu_type:
-    system.mem_mode = "atomic"
-else:
-    system.mem_mode = "timing"
 
-# Memory range at standard RISC-V base address
-system.mem_ranges = [AddrRange(start=0x80000000, size=args.mem_size)]
-
-# =============================================================================
-# HiFive Platform (UART, CLINT, PLIC at standard addresses)
-# =============================================================================
-
-system.platform = HiFive()
-
-# Redirect terminal output to stdout (required for non-interactive/CI runs)
-# Default "file" dumps to a file; "stdoutput" prints to gem5's stdout
-system.platform.terminal.outfile = "stdoutput"
-
-# RTCCLK for CLINT timer
-system.platform.rtc = RiscvRTC(frequency=Frequency("100MHz"))
-system.platform.clint.int_pin = system.platform.rtc.int_pin
-
-# IO and memory buses
-system.iobus = IOXBar()
-system.membus = SystemXBar()
-system.system_port = system.membus.cpu_side_ports
-
-# Connect platform PCI host to IO bus (required for HiFive off-chip devices)
-system.iobus.cpu_side_ports = system.platform.pci_host.up_request_port()
-system.iobus.mem_side_ports = system.platform.pci_host.up_response_port()
-system.platform.pci_bus.cpu_side_ports = (
-    system.platform.pci_host.down_request_port()
-)
-system.platform.pci_bus.default = system.platform.pci_host.down_response_port()
-system.platform.pci_bus.config_error_port = (
-    system.platform.pci_host.config_error.pio
-)
-
-# Bridge: IO bus <-> memory bus
-system.bridge = Bridge(delay="50ns")
-system.bridge.mem_side_port = system.iobus.cpu_side_ports
-system.bridge.cpu_side_port = system.membus.mem_side_ports
-system.bridge.ranges = system.platform._off_chip_ranges()
-
-# Attach platform devices (CLINT, PLIC to membus; UART to iobus)
-system.platform.attachOnChipIO(system.membus)
-system.platform.attachOffChipIO(system.iobus)
-system.platform.attachPlic()
-system.platform.setNumCores(args.num_cpus)
-
-# =============================================================================
-# CPU Configuration
-# =============================================================================
-
-cpu_class = getattr(m5.objects, args.cpu_type)
-system.cpu = [cpu_class() for _ in range(args.num_cpus)]
-
-# Configure each CPU
-for i, cpu in enumerate(system.cpu):
-    cpu.cpu_id = i
-    cpu.createInterruptController()
-    cpu.createThreads()
-
-# PMA checker for uncacheable device regions
-uncacheable_range = [
-    *system.platform._on_chip_ranges(),
-    *system.platform._off_chip_ranges(),
-]
-for cpu in system.cpu:
-    cpu.mmu.pma_checker = PMAChecker(uncacheable=uncacheable_range)
-
-# =============================================================================
-# Memory Hierarchy
-# =============================================================================
-
-if "Atomic" in args.cpu_type:
-    # Atomic CPU: connect directly to memory bus (no caches needed)
-    for cpu in system.cpu:
-        cpu.icache_port = system.membus.cpu_side_ports
-        cpu.dcache_port = system.membus.cpu_side_ports
-else:
-    # Timing/Minor/O3 CPU: add L1 caches
-    system.l2bus = L2XBar()
-
-    for cpu in system.cpu:
-        cpu.icache = Cache(
-            size=args.l1i_size,
-            assoc=2,
-            tag_latency=1,
-            data_latency=1,
-            response_latency=1,
-            mshrs=4,
-            tgts_per_mshr=8,
-        )
-        cpu.icache.cpu_side = cpu.icache_port
-        cpu.icache.mem_side = system.l2bus.cpu_side_ports
-
-        cpu.dcache = Cache(
-            size=args.l1d_size,
-            assoc=4,
-            tag_latency=2,
-            data_latency=2,
-            response_latency=2,
-            mshrs=16,
-            tgts_per_mshr=8,
-        )
-        cpu.dcache.cpu_side = cpu.dcache_port
-        cpu.dcache.mem_side = system.l2bus.cpu_side_ports
-
-    system.l2cache = Cache(
-        size=args.l2_size,
-        assoc=8,
-        tag_latency=10,
-        data_latency=10,
-        response_latency=10,
-        mshrs=20,
-        tgts_per_mshr=12,
-    )
-    system.l2cache.cpu_side = system.l2bus.mem_side_ports
-    system.l2cache.mem_side = system.membus.cpu_side_ports
-
-# =============================================================================
-# Memory Controller
-# =============================================================================
-
-system.mem_ctrl = MemCtrl()
-system.mem_ctrl.dram = DDR4_2400_16x4()
-system.mem_ctrl.dram.range = system.mem_ranges[0]
-system.mem_ctrl.port = system.membus.mem_side_ports
-
-# IO bridge for memory access from IO devices
-system.iobridge = Bridge(delay="50ns", ranges=system.mem_ranges)
-system.iobridge.cpu_side_port = system.iobus.mem_side_ports
-system.iobridge.mem_side_port = system.membus.cpu_side_ports
+system = build_system(args, full_system=True)
 
 # =============================================================================
 # Workload (Bare-Metal)
@@ -239,38 +89,8 @@ system.workload = RiscvBareMetal()
 system.workload.bootloader = args.cmd
 
 # =============================================================================
-# Root and Instantiation
+# Root, Instantiation and Simulation
 # =============================================================================
 
 root = Root(full_system=True, system=system)
-m5.instantiate()
-
-# =============================================================================
-# Simulation
-# =============================================================================
-
-print(f"[gem5] Starting FS simulation:")
-print(f"[gem5]   Binary:    {args.cmd}")
-print(f"[gem5]   CPU Type:  {args.cpu_type}")
-print(f"[gem5]   Num CPUs:  {args.num_cpus}")
-print(f"[gem5]   Mem Size:  {args.mem_size}")
-print(f"[gem5]   Max Ticks: {args.max_ticks}")
-if "Atomic" not in args.cpu_type:
-    print(f"[gem5]   L1d Size:  {args.l1d_size}")
-    print(f"[gem5]   L1i Size:  {args.l1i_size}")
-    print(f"[gem5]   L2 Size:   {args.l2_size}")
-print()
-
-exit_event = m5.simulate(args.max_ticks)
-
-print()
-print(f"[gem5] Simulation finished at tick {m5.curTick()}")
-print(f"[gem5] Exit cause: {exit_event.getCause()}")
-print(f"[gem5] Exit code:  {exit_event.getCode()}")
-
-# Print basic stats summary
-stats_file = os.path.join(m5.options.outdir, "stats.txt")
-if os.path.exists(stats_file):
-    print(f"[gem5] Stats file: {stats_file}")
-
-sys.exit(exit_event.getCode())
+sys.exit(run_simulation(args, "FS", system))
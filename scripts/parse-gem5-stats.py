@@ -23,86 +23,299 @@ Options:
   --compare     Compare two stats files side by side
   --verbose     Show all parsed stats
   --filter KEY  Only show stats matching KEY pattern
+  --no-cache    Re-parse even if a current <stats_file>.metrics.json exists
+
+Only the Python standard library is required. If pandas is installed, it is
+used to tokenize large stats files in C, and orjson, if installed, speeds up
+--json output.
 """
 
 import argparse
+import csv
+import functools
 import json
+import mmap
 import os
 import re
+import stat
 import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 
+try:
+    import pandas as pd
+except ImportError:  # optional: falls back to the pure-Python regex parser
+    pd = None
 
-def parse_stats_file(filepath):
-    """Parse a gem5 stats.txt file and return a dictionary of stats."""
-    stats = {}
+# stdlib json drops its C encoder whenever indent is set; orjson does not
+try:
+    import orjson
 
-    if not os.path.exists(filepath):
-        print(f"Error: Stats file not found: {filepath}", file=sys.stderr)
-        return stats
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 
-    with open(filepath, "r") as f:
-        for line in f:
-            line = line.strip()
+except ImportError:  # optional: falls back to stdlib json
 
-            # Skip comments and empty lines
-            if not line or line.startswith("---") or line.startswith("==="):
-                continue
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
 
-            # Parse stat lines: "stat_name  value  # description"
-            match = re.match(r"^(\S+)\s+([\d.eE+-]+(?:%?)?)\s*(?:#.*)?$", line)
-            if match:
-                name = match.group(1)
-                value_str = match.group(2)
+# Stat lines look like "stat_name  value  # description". Compiled once and run
+# over the whole file so the per-line loop stays inside the regex engine.
+# Leading blanks are skipped, as the pandas path does; the name's first-byte
+# class then rejects banner ("---- Begin ... ----", "===="), comment and blank
+# lines before any backtracking.
+_STAT_RE = re.compile(
+    rb"^[ \t]*([^\s#=\-]\S*)[ \t]+([\d.eE+\-]+%?)(?:[ \t]+#[^\n]*)?[ \t\r]*$",
+    re.MULTILINE,
+)
 
-                # Try to convert to numeric
-                try:
-                    if "." in value_str or "e" in value_str.lower():
-                        value = float(value_str.rstrip("%"))
-                    else:
-                        value = int(value_str)
-                except ValueError:
-                    value = value_str
 
-                stats[name] = value
+def _scan_stats(data, filter_re=None, wanted=None):
+    """Run _STAT_RE over a buffer; return the stats, or None if no line matched."""
+    stats = {}
+    found = False
+    for match in _STAT_RE.finditer(data):
+        found = True
+        name = match.group(1)
+        if wanted is not None and name not in wanted:
+            continue
+        name = name.decode()
+        if filter_re is not None and not filter_re.search(name):
+            continue
+        value_str = match.group(2)
+
+        # Try to convert to numeric
+        try:
+            if b"." in value_str or b"e" in value_str or b"E" in value_str:
+                value = float(value_str.rstrip(b"%"))
+            else:
+                value = int(value_str)
+        except ValueError:
+            value = value_str.decode()
+
+        stats[name] = value
+    return stats if found else None
+
+
+def _parse_with_regex(filepath, filter_re=None, wanted=None):
+    """Parse stats with the compiled _STAT_RE (no third-party dependencies)."""
+    if wanted is not None:
+        # Compare raw names so unwanted lines are never decoded
+        wanted = {name.encode() for name in wanted}
+
+    # Scan a read-only mapping instead of reading the file into memory; FS
+    # runs with periodic stat dumps can produce hundreds of MB of stats.txt.
+    # Pipes (/dev/stdin, <(zcat ...)) and empty files cannot be mapped.
+    with open(filepath, "rb") as f:
+        st = os.fstat(f.fileno())
+        if not (stat.S_ISREG(st.st_mode) and st.st_size):
+            return _scan_stats(f.read(), filter_re, wanted)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _scan_stats(data, filter_re, wanted)
+
+
+def _float_or_nan(value_str):
+    try:
+        return float(value_str)
+    except ValueError:
+        return float("nan")
+
+
+def _is_stat_row(df):
+    """Mask of the "name value" rows _STAT_RE accepts."""
+    return (
+        (df["extra"] == "")
+        & df["value"].str.fullmatch(r"[\d.eE+\-]+%?")
+        & ~df["name"].str.match(r"[=\-]")
+    )
+
 
+def _parse_with_pandas(filepath, filter_re=None, wanted=None):
+    """Parse stats with pandas' C tokenizer and vectorized numeric conversion."""
+    # A third column catches distribution rows ("name count pct cum%") and the
+    # "---- Begin ... ----" banners; index_col=False stops pandas from turning
+    # the banner's extra fields into an index, at the cost of a ParserWarning.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", pd.errors.ParserWarning)
+        try:
+            df = pd.read_csv(
+                filepath,
+                sep=r"\s+",
+                comment="#",
+                header=None,
+                names=["name", "value", "extra"],
+                index_col=False,
+                engine="c",
+                on_bad_lines="skip",
+                dtype=str,
+                na_filter=False,
+            )
+        except pd.errors.EmptyDataError:
+            return None
+
+    wanted_df = df if wanted is None else df[df["name"].isin(wanted)]
+    wanted_df = wanted_df[_is_stat_row(wanted_df)]
+    if wanted_df.empty and (wanted is None or not _is_stat_row(df).any()):
+        return None  # no stat lines at all, as opposed to none wanted
+    df = wanted_df
+    if filter_re is not None:
+        df = df[df["name"].str.contains(filter_re)]
+    df = df.drop_duplicates("name", keep="last")
+
+    raw = df["value"]
+    is_float = raw.str.contains(r"[.eE]")
+    is_int = ~is_float & raw.str.fullmatch(r"[+\-]?\d+")
+
+    # astype rounds like float(); pd.to_numeric can be off by an ulp
+    float_strs = raw[is_float].str.rstrip("%")
+    try:
+        floats = float_strs.astype("float64")
+    except ValueError:
+        floats = float_strs.map(_float_or_nan).astype("float64")
+    ints = raw[is_int]
+    try:
+        int_values = ints.astype("int64").tolist()
+    except OverflowError:
+        # gem5 counters are unsigned 64-bit; keep exact Python ints
+        int_values = [int(v) for v in ints.tolist()]
+
+    # Anything that did not convert keeps its original string
+    strings = raw[(is_float & floats.reindex(raw.index).isna()) | ~(is_float | is_int)]
+
+    stats = dict(zip(df["name"][is_int].tolist(), int_values))
+    stats.update(zip(df["name"][floats.index].tolist(), floats.tolist()))
+    stats.update(zip(df["name"][strings.index].tolist(), strings.tolist()))
     return stats
 
 
-def extract_key_metrics(stats, cpu_id=0):
-    """Extract key performance metrics from parsed stats."""
-    prefix = f"system.cpu" if cpu_id == 0 else f"system.cpu{cpu_id}"
-
-    # Try both cpu and cpu0 naming conventions
-    def get_stat(name, default=None):
-        # Try exact name first
-        if name in stats:
-            return stats[name]
-        # Try with cpu prefix
-        full_name = f"{prefix}.{name}"
-        if full_name in stats:
-            return stats[full_name]
-        # Try system-level
-        sys_name = f"system.{name}"
-        if sys_name in stats:
-            return stats[sys_name]
-        return default
+def parse_stats_file(filepath, filter_re=None, wanted=None):
+    """Parse a gem5 stats.txt file and return a dictionary of stats.
 
-    metrics = {}
+    If filter_re (a compiled pattern) is given, only stats whose name it
+    matches are converted and kept; likewise for names in the wanted set.
+    Uses pandas when it is installed and the built-in regex parser otherwise;
+    both return the same dictionary.
+    """
+    stats = _read_stats(filepath, filter_re, wanted)
+    return {} if stats is None else stats
 
-    # Simulation info
-    metrics["sim_ticks"] = get_stat("simTicks", stats.get("simTicks"))
-    metrics["sim_seconds"] = get_stat("simSeconds", stats.get("simSeconds"))
-    metrics["sim_insts"] = get_stat("simInsts", stats.get("simInsts"))
-    metrics["sim_ops"] = get_stat("simOps", stats.get("simOps"))
-    metrics["host_seconds"] = get_stat("hostSeconds", stats.get("hostSeconds"))
 
+def _read_stats(filepath, filter_re=None, wanted=None):
+    """Like parse_stats_file, but return None for unreadable or stat-less files."""
+    try:
+        if pd is not None:
+            return _parse_with_pandas(filepath, filter_re, wanted)
+        return _parse_with_regex(filepath, filter_re, wanted)
+    except FileNotFoundError:
+        print(f"Error: Stats file not found: {filepath}", file=sys.stderr)
+    except OSError as err:
+        print(
+            f"Error: Cannot read stats file {filepath}: {err.strerror}",
+            file=sys.stderr,
+        )
+    return None
+
+
+# Metrics reported by extract_key_metrics, in output order, with the stat
+# names that can supply them. Names are tried as-is, under the switched-in CPU
+# prefix ("system.switch_cpus[N]", where sampled runs record the detailed
+# CPU), under the CPU prefix ("system.cpu[N]") and under "system."; exact
+# names are looked up verbatim. Derived metrics list no names and are
+# computed afterwards.
+_METRIC_STATS = (
+    # Simulation info
+    ("sim_ticks", ("simTicks",), False),
+    ("sim_seconds", ("simSeconds",), False),
+    ("sim_insts", ("simInsts",), False),
+    ("sim_ops", ("simOps",), False),
+    ("host_seconds", ("hostSeconds",), False),
     # CPU performance
-    metrics["num_cycles"] = get_stat("numCycles")
-    metrics["num_insts"] = get_stat(
-        "committedInsts", get_stat("numInsts", get_stat("exec_context.thread_0.numInsts"))
-    )
-    metrics["cpi"] = get_stat("cpi")
-    metrics["ipc"] = get_stat("ipc")
+    ("num_cycles", ("numCycles",), False),
+    (
+        "num_insts",
+        ("committedInsts", "numInsts", "exec_context.thread_0.numInsts"),
+        False,
+    ),
+    ("cpi", ("cpi",), False),
+    ("ipc", ("ipc",), False),
+    # Cache statistics (L1 Data)
+    ("l1d_hits", ("dcache.overallHits::total",), False),
+    ("l1d_misses", ("dcache.overallMisses::total",), False),
+    ("l1d_accesses", ("dcache.overallAccesses::total",), False),
+    ("l1d_hit_rate", (), True),
+    # Cache statistics (L1 Instruction)
+    ("l1i_hits", ("icache.overallHits::total",), False),
+    ("l1i_misses", ("icache.overallMisses::total",), False),
+    ("l1i_accesses", ("icache.overallAccesses::total",), False),
+    ("l1i_hit_rate", (), True),
+    # Cache statistics (L2)
+    ("l2_hits", ("system.l2cache.overallHits::total",), True),
+    ("l2_misses", ("system.l2cache.overallMisses::total",), True),
+    ("l2_accesses", ("system.l2cache.overallAccesses::total",), True),
+    ("l2_hit_rate", (), True),
+    # Memory controller; SimpleMemory (the Atomic default) has no
+    # readReqs/writeReqs and only counts requests in numReads/numWrites
+    (
+        "mem_reads",
+        ("system.mem_ctrl.readReqs", "system.mem_ctrl.numReads::total"),
+        True,
+    ),
+    (
+        "mem_writes",
+        ("system.mem_ctrl.writeReqs", "system.mem_ctrl.numWrites::total"),
+        True,
+    ),
+)
+
+
+def _build_key_map(cpu_id):
+    """Map each metric to its fully qualified candidate stat names for cpu_id."""
+    if cpu_id == 0:
+        # gem5 drops the index when there is only one CPU
+        prefixes = (
+            "system.switch_cpus",
+            "system.switch_cpus0",
+            "system.cpu",
+            "system.cpu0",
+            "system",
+        )
+    else:
+        prefixes = (f"system.switch_cpus{cpu_id}", f"system.cpu{cpu_id}", "system")
+    key_map = {}
+    for metric, names, exact in _METRIC_STATS:
+        if exact:
+            key_map[metric] = names
+        else:
+            key_map[metric] = tuple(
+                key for name in names
+                for key in (name, *(f"{prefix}.{name}" for prefix in prefixes))
+            )
+    return key_map
+
+
+# Pre-expanded for the CPU counts the gem5 configs support (1-8)
+_KEY_MAPS = {cpu_id: _build_key_map(cpu_id) for cpu_id in range(8)}
+
+
+def metric_stat_names(cpu_id=0):
+    """Return every stat name extract_key_metrics may read for cpu_id."""
+    key_map = _KEY_MAPS.get(cpu_id) or _build_key_map(cpu_id)
+    return frozenset(key for candidates in key_map.values() for key in candidates)
+
+
+def extract_key_metrics(stats, cpu_id=0):
+    """Extract key performance metrics from parsed stats."""
+    key_map = _KEY_MAPS.get(cpu_id) or _build_key_map(cpu_id)
+
+    # First candidate present in stats wins
+    metrics = {}
+    for metric, candidates in key_map.items():
+        value = None
+        for key in candidates:
+            if key in stats:
+                value = stats[key]
+                break
+        metrics[metric] = value
 
     # Calculate CPI/IPC if not directly available
     if metrics["cpi"] is None and metrics["num_cycles"] and metrics["num_insts"]:
@@ -110,38 +323,119 @@ def extract_key_metrics(stats, cpu_id=0):
             metrics["cpi"] = metrics["num_cycles"] / metrics["num_insts"]
             metrics["ipc"] = metrics["num_insts"] / metrics["num_cycles"]
 
-    # Cache statistics (L1 Data)
-    metrics["l1d_hits"] = get_stat("dcache.overallHits::total")
-    metrics["l1d_misses"] = get_stat("dcache.overallMisses::total")
-    metrics["l1d_accesses"] = get_stat("dcache.overallAccesses::total")
-    if metrics["l1d_accesses"] and metrics["l1d_accesses"] > 0 and metrics["l1d_hits"]:
-        metrics["l1d_hit_rate"] = metrics["l1d_hits"] / metrics["l1d_accesses"] * 100.0
-    else:
-        metrics["l1d_hit_rate"] = None
+    # Hit rates
+    for cache in ("l1d", "l1i", "l2"):
+        hits = metrics[f"{cache}_hits"]
+        accesses = metrics[f"{cache}_accesses"]
+        if accesses and accesses > 0 and hits:
+            metrics[f"{cache}_hit_rate"] = hits / accesses * 100.0
 
-    # Cache statistics (L1 Instruction)
-    metrics["l1i_hits"] = get_stat("icache.overallHits::total")
-    metrics["l1i_misses"] = get_stat("icache.overallMisses::total")
-    metrics["l1i_accesses"] = get_stat("icache.overallAccesses::total")
-    if metrics["l1i_accesses"] and metrics["l1i_accesses"] > 0 and metrics["l1i_hits"]:
-        metrics["l1i_hit_rate"] = metrics["l1i_hits"] / metrics["l1i_accesses"] * 100.0
-    else:
-        metrics["l1i_hit_rate"] = None
+    return metrics
 
-    # Cache statistics (L2)
-    metrics["l2_hits"] = stats.get("system.l2cache.overallHits::total")
-    metrics["l2_misses"] = stats.get("system.l2cache.overallMisses::total")
-    metrics["l2_accesses"] = stats.get("system.l2cache.overallAccesses::total")
-    if metrics["l2_accesses"] and metrics["l2_accesses"] > 0 and metrics["l2_hits"]:
-        metrics["l2_hit_rate"] = metrics["l2_hits"] / metrics["l2_accesses"] * 100.0
-    else:
-        metrics["l2_hit_rate"] = None
 
-    # Memory controller
-    metrics["mem_reads"] = stats.get("system.mem_ctrl.readReqs")
-    metrics["mem_writes"] = stats.get("system.mem_ctrl.writeReqs")
+# Extracted metrics are cached next to each stats file, in
+# "<stats_file>.metrics.json": a header line holding the cache key, then the
+# metrics as JSON. The key changes whenever the stats file is rewritten or
+# METRICS_CACHE_VERSION is bumped; bump it whenever parsing or the extracted
+# metrics change, so sidecars written by older versions are not served.
+METRICS_CACHE_SUFFIX = ".metrics.json"
+METRICS_CACHE_VERSION = 6
+
+
+def _metrics_cache_key(filepath, cpu_id):
+    st = os.stat(filepath)
+    return f"v{METRICS_CACHE_VERSION}:{st.st_mtime_ns}:{st.st_size}:{cpu_id}"
+
+
+def _load_cached_metrics(filepath, key):
+    """Return cached metrics for filepath if the sidecar matches key."""
+    try:
+        with open(filepath + METRICS_CACHE_SUFFIX, "r") as f:
+            if f.readline().rstrip("\n") != key:
+                return None
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cached_metrics(filepath, key, metrics):
+    # Best effort: stats directories may be read-only
+    try:
+        with open(filepath + METRICS_CACHE_SUFFIX, "w") as f:
+            f.write(f"{key}\n")
+            json.dump(metrics, f)
+    except OSError:
+        pass
+
+
+def load_stats(filepath, cpu_id=0, use_cache=False, filter_re=None, all_stats=False):
+    """Parse one stats file and return (filepath, stats, metrics).
+
+    metrics is None if the file held no stats, and empty with filter_re.
+    """
+    key = None
+    if use_cache:
+        try:
+            key = _metrics_cache_key(filepath, cpu_id)
+        except OSError:
+            pass  # _read_stats reports the missing file
+        else:
+            metrics = _load_cached_metrics(filepath, key)
+            if metrics is not None:
+                return filepath, {}, metrics
+
+    if filter_re is not None:
+        stats = _read_stats(filepath, filter_re)
+        if stats is None:
+            return filepath, {}, None
+        return filepath, stats, {}
+
+    wanted = None if all_stats else metric_stat_names(cpu_id)
+    stats = _read_stats(filepath, wanted=wanted)
+    if not stats:
+        return filepath, stats or {}, None
+
+    metrics = extract_key_metrics(stats, cpu_id)
+    if key is not None:
+        _save_cached_metrics(filepath, key, metrics)
+    return filepath, stats, metrics
+
+
+# Columns written by --csv, after the leading "file" column
+CSV_KEYS = [
+    "sim_ticks", "sim_insts", "num_cycles", "cpi", "ipc",
+    "l1d_hit_rate", "l1i_hit_rate", "l2_hit_rate",
+]
+
+
+# Sweep tables can run to thousands of rows; write them through one large
+# buffer rather than flushing stdout line by line.
+TABLE_OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def open_table_output():
+    """Open a buffered text stream over stdout (closing it only flushes)."""
+    sys.stdout.flush()
+    return open(
+        sys.stdout.fileno(),
+        "w",
+        buffering=TABLE_OUTPUT_BUFFER_SIZE,
+        newline="",
+        closefd=False,
+    )
 
-    return metrics
+
+def build_metrics_frame(results):
+    """Collect per-file metrics into a (files x metrics) pandas DataFrame.
+
+    Columns keep the Python values from extract_key_metrics (object dtype), so
+    integer counters are not widened to float by files missing a stat.
+    """
+    return pd.DataFrame(
+        [metrics for _, _, metrics in results],
+        index=[filepath for filepath, _, _ in results],
+        dtype=object,
+    )
 
 
 def print_metrics(metrics, title="gem5 Performance Metrics"):
@@ -270,6 +564,11 @@ def main():
     parser.add_argument(
         "--cpu-id", type=int, default=0, help="CPU ID to extract stats for"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always re-parse; ignore and do not write {METRICS_CACHE_SUFFIX} files",
+    )
 
     args = parser.parse_args()
 
@@ -277,14 +576,36 @@ def main():
         print("Error: --compare requires exactly 2 stats files", file=sys.stderr)
         sys.exit(1)
 
+    # Files are independent, so parse sweeps in parallel; a single file is
+    # parsed in-process to avoid the pool start-up cost.
+    # --verbose prints the raw stats (unless --json/--csv/--compare takes
+    # precedence), which the metrics cache does not hold; its --filter is
+    # applied while parsing so unmatched stats are never built.
+    files = args.stats_files
+    print_raw = args.verbose and not (args.json or args.csv or args.compare)
+    use_cache = not (args.no_cache or print_raw)
+    filter_re = None
+    if print_raw and args.filter:
+        filter_re = re.compile(args.filter, re.IGNORECASE)
+    load = functools.partial(
+        load_stats,
+        cpu_id=args.cpu_id,
+        use_cache=use_cache,
+        filter_re=filter_re,
+        all_stats=print_raw,
+    )
+    if len(files) >= 2:
+        workers = min(len(files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            loaded = list(executor.map(load, files))
+    else:
+        loaded = [load(files[0])]
+
     results = []
-    for filepath in args.stats_files:
-        stats = parse_stats_file(filepath)
-        if not stats:
+    for filepath, stats, metrics in loaded:
+        if metrics is None:
             print(f"Warning: No stats parsed from {filepath}", file=sys.stderr)
             continue
-
-        metrics = extract_key_metrics(stats, args.cpu_id)
         results.append((filepath, stats, metrics))
 
     if not results:
@@ -296,32 +617,28 @@ def main():
         for filepath, _, metrics in results:
             # Filter out None values for JSON
             output[filepath] = {k: v for k, v in metrics.items() if v is not None}
-        print(json.dumps(output, indent=2))
+        sys.stdout.write(_dumps(output) + "\n")
     elif args.csv:
-        # CSV header
-        keys = [
-            "file", "sim_ticks", "sim_insts", "num_cycles", "cpi", "ipc",
-            "l1d_hit_rate", "l1i_hit_rate", "l2_hit_rate",
-        ]
-        print(",".join(keys))
-        for filepath, _, metrics in results:
-            values = [filepath]
-            for k in keys[1:]:
-                v = metrics.get(k)
-                values.append(str(v) if v is not None else "")
-            print(",".join(values))
+        with open_table_output() as out:
+            if pd is not None:
+                metrics_df = build_metrics_frame(results)
+                # reindex: a metric missing from every file is a blank column
+                metrics_df.reindex(columns=CSV_KEYS).to_csv(out, index_label="file")
+            else:
+                writer = csv.writer(out, lineterminator="\n")
+                writer.writerow(["file"] + CSV_KEYS)
+                for filepath, _, metrics in results:
+                    writer.writerow([filepath] + [metrics.get(k) for k in CSV_KEYS])
     elif args.compare:
         title1 = os.path.basename(os.path.dirname(results[0][0])) or results[0][0]
         title2 = os.path.basename(os.path.dirname(results[1][0])) or results[1][0]
         print_comparison(results[0][2], results[1][2], title1, title2)
     elif args.verbose:
         for filepath, stats, _ in results:
-            print(f"\n--- All stats from {filepath} ---")
-            if args.filter:
-                pattern = re.compile(args.filter, re.IGNORECASE)
-                stats = {k: v for k, v in stats.items() if pattern.search(k)}
-            for name in sorted(stats.keys()):
-                print(f"  {name}: {stats[name]}")
+            # One write per file; --filter was already applied while parsing
+            lines = [f"\n--- All stats from {filepath} ---"]
+            lines.extend(f"  {name}: {stats[name]}" for name in sorted(stats))
+            sys.stdout.write("\n".join(lines) + "\n")
     else:
         for filepath, _, metrics in results:
             print_metrics(metrics, title=f"gem5 Stats: {os.path.basename(filepath)}")